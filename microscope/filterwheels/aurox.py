@@ -96,11 +96,18 @@ class Clarity(microscope.devices.FilterWheelBase):
         __GETSERIAL: 4,
         __FULLSTAT: 10,
     }
+    # Commands whose reply is a single value rather than a sequence.
+    _single_value_results = frozenset(
+        cmd for cmd, n in _resultlen.items() if n == 1
+    )
 
     def __init__(self, **kwargs):
         super().__init__(positions=Clarity._positions, **kwargs)
         self._lock = Lock()
         self._hid = None
+        # Path of the device, found on first open and reused on reopen
+        # to avoid enumerating all HID devices again.
+        self._hid_path = None
         self.add_setting(
             "sectioning",
             "enum",
@@ -111,11 +118,13 @@ class Clarity(microscope.devices.FilterWheelBase):
 
     def _send_command(self, command, param=0, max_length=16, timeout_ms=100):
         """Send a command to the Clarity and return its response"""
-        if not self._hid:
-            self.open()
         with self._lock:
-            # The device expects a list of 16 integers
-            buffer = [0x00] * max_length  # The 0th element must be 0.
+            if self._hid is None:
+                raise microscope.DeviceError("Clarity is not connected.")
+            # The device expects a report of 16 bytes.  hidapi accepts
+            # any bytes-like object, which avoids converting a list of
+            # ints element by element.
+            buffer = bytearray(max_length)  # The 0th element must be 0.
             buffer[1] = command  # The 1st element is the command
             buffer[2] = param  # The 2nd element is any command argument.
             result = self._hid.write(buffer)
@@ -136,21 +145,27 @@ class Clarity(microscope.devices.FilterWheelBase):
                     return None
                 elif response[0] == command:
                     break
-            bytes = self._resultlen.get(command, None)
-            if bytes is None:
-                return response[1:]
-            elif bytes == 1:
+            if command in self._single_value_results:
                 return response[1]
-            else:
-                return response[1:]
+            return response[1:]
 
     @property
     def is_connected(self):
         return self._hid is not None
 
     def open(self):
+        if self._hid_path is None:
+            devices = hid.enumerate(__VENDORID, __PRODUCTID)
+            if not devices:
+                raise microscope.DeviceError("No Clarity device found.")
+            self._hid_path = devices[0]["path"]
         h = hid.device()
-        h.open(vendor_id=__VENDORID, product_id=__PRODUCTID)
+        try:
+            h.open_path(self._hid_path)
+        except OSError:
+            # The device may have been reconnected under a new path.
+            self._hid_path = None
+            raise
         h.set_nonblocking(False)
         self._hid = h
 
@@ -159,19 +174,26 @@ class Clarity(microscope.devices.FilterWheelBase):
             self._hid.close()
             self._hid = None
 
+    def _ensure_open(self):
+        """Open the connection to the device if it is not already open."""
+        if not self.is_connected:
+            self.open()
+
     def get_id(self):
+        self._ensure_open()
         return self._send_command(__GETSERIAL)
 
     def _do_enable(self):
-        if not self.is_connected:
-            self.open()
+        self._ensure_open()
         self._send_command(__SETONOFF, __RUN)
         return self._send_command(__GETONOFF) == __RUN
 
     def _do_disable(self):
+        self._ensure_open()
         self._send_command(__SETONOFF, __SLEEP)
 
     def set_calibration(self, state):
+        self._ensure_open()
         if state:
             result = self._send_command(__SETCAL, __CALON)
         else:
@@ -180,6 +202,7 @@ class Clarity(microscope.devices.FilterWheelBase):
 
     def get_slide_position(self):
         """Get the current slide position"""
+        self._ensure_open()
         result = self._send_command(__GETSLIDE)
         if result is None:
             raise microscope.DeviceError("Slide position error.")
@@ -187,6 +210,7 @@ class Clarity(microscope.devices.FilterWheelBase):
 
     def set_slide_position(self, position, blocking=True):
         """Set the slide position"""
+        self._ensure_open()
         result = self._send_command(__SETSLIDE, position)
         if result is None:
             raise microscope.DeviceError("Slide position error.")
@@ -195,29 +219,31 @@ class Clarity(microscope.devices.FilterWheelBase):
         return result
 
     def get_slides(self):
-        return self._slide_to_sectioning
+        # A copy so that callers can't modify the class table.
+        return dict(self._slide_to_sectioning)
 
     def get_status(self):
+        self._ensure_open()
         # Fetch 10 bytes VERSION[3],ONOFF,SHUTTER,SLIDE,FILT,CAL,??,??
         result = self._send_command(__FULLSTAT)
         if result is None:
             return
+        onoff, door_state, slide, filter, cal = result[3:8]
         # A status dict to populate and return
         status = {}
         # A list to track states, any one of which mean the device is busy.
         busy = []
         # Disk running
-        status["on"] = result[3] == __RUN
+        status["on"] = onoff == __RUN
         # Door open
         # Note - it appears that the __DOOROPEN and __DOORCLOSED status states
         # are switched, or that the DOOR is in fact an internal shutter. I'll
         # interpret 'door' as the external door here, as that is what the user
-        # can see. When the external door is open, result[4] == __DOORCLOSED
-        door = result[4] == __DOORCLOSED
+        # can see. When the external door is open, door_state == __DOORCLOSED
+        door = door_state == __DOORCLOSED
         status["door open"] = door
         busy.append(door)
         # Slide position
-        slide = result[5]
         if slide == __SLDMID:
             # Slide is moving
             status["slide"] = (None, "moving")
@@ -228,15 +254,14 @@ class Clarity(microscope.devices.FilterWheelBase):
                 self._slide_to_sectioning.get(slide, None),
             )
         # Filter position
-        filter = result[6]
         if filter == __FLTMID:
             # Filter is moving
             status["filter"] = (None, "moving")
             busy.append(True)
         else:
-            status["filter"] = result[6]
+            status["filter"] = filter
         # Calibration LED on
-        status["calibration"] = result[7] == __CALON
+        status["calibration"] = cal == __CALON
         # Slide or filter moving
         status["busy"] = any(busy)
         return status
@@ -254,17 +279,17 @@ class Clarity(microscope.devices.FilterWheelBase):
         # Can return false negatives on long moves, so OR 5 readings.
         moving = False
         for i in range(5):
-            moving = moving or any(
-                (
-                    self.get_slide_position() == __SLDMID,
-                    self.get_position() == __FLTMID,
-                )
+            moving = (
+                moving
+                or self.get_slide_position() == __SLDMID
+                or self.get_position() == __FLTMID
             )
             time.sleep(0.01)
         return moving
 
     def _do_get_position(self):
         """Return the current filter position"""
+        self._ensure_open()
         result = self._send_command(__GETFILT)
         if result == __FLTERR:
             raise microscope.DeviceError("Filter position error.")
@@ -272,6 +297,7 @@ class Clarity(microscope.devices.FilterWheelBase):
 
     def _do_set_position(self, pos, blocking=True):
         """Set the filter position"""
+        self._ensure_open()
         result = self._send_command(__SETFILT, pos)
         if result is None:
             raise microscope.DeviceError("Filter position error.")
@@ -17,9 +17,8 @@
 ## You should have received a copy of the GNU General Public License
 ## along with Microscope.  If not, see <http://www.gnu.org/licenses/>.
 
-import io
-import string
 import threading
+import time
 import warnings
 
 import serial
@@ -41,8 +40,9 @@ class ThorlabsFilterWheel(microscope.abc.FilterWheel):
         :param baud: baud rate
         :param timeout: serial timeout
         """
-        self.eol = "\r"
-        rawSerial = serial.Serial(
+        self.eol = b"\r"
+        self.prompt = b">"
+        self.connection = serial.Serial(
             port=com,
             baudrate=baud,
             timeout=timeout,
@@ -54,62 +54,106 @@ class ThorlabsFilterWheel(microscope.abc.FilterWheel):
         # The Thorlabs controller serial implementation is strange.
         # Generally, it uses \r as EOL, but error messages use \n.
         # A readline after sending a 'pos?\r' command always times out,
-        # but returns a string terminated by a newline.
-        # We use TextIOWrapper with newline=None to perform EOL translation
-        # inbound, but must explicitly append \r to outgoing commands.
-        # The TextIOWrapper also deals with conversion between unicode
-        # and bytes.
-        self.connection = io.TextIOWrapper(
-            rawSerial,
-            newline=None,
-            line_buffering=True,  # flush on write
-            write_through=True,  # write out immediately
-        )
+        # because the reply lines are terminated by \r.  Every
+        # response does end with a '>' prompt though, so we read the
+        # whole response up to the prompt and split it into lines
+        # ourselves.  The protocol is plain ASCII so we talk bytes to
+        # the port and only decode the result.
         # A lock for the connection.  We should probably be using
         # SharedSerial (maybe change it to SharedIO, and have it
         # accept any IOBase implementation).
-        self._lock = threading.RLock()
+        self._lock = threading.Lock()
+        # The last known position and the time it was read.  Clients
+        # are expected to poll the position, so reuse it for queries
+        # made within position_ttl seconds instead of going to the
+        # device each time.
+        self._position_cache = (None, 0.0)
+        self.position_ttl = 0.05
         position_count = int(self._send_command("pcount?"))
+        # Thorlabs positions start at 1, hence the +1
+        self._set_position_commands = [
+            "pos=%d" % (i + 1) for i in range(position_count)
+        ]
         super().__init__(positions=position_count, **kwargs)
 
     def _do_shutdown(self) -> None:
         pass
 
-    def _do_set_position(self, new_position: int) -> None:
-        # Thorlabs positions start at 1, hence the +1
-        self._send_command("pos=%d" % (new_position + 1))
+    def _get_cached_position_locked(self):
+        """Cached position, or `None` if it is older than `position_ttl`."""
+        position, read_time = self._position_cache
+        if time.monotonic() - read_time < self.position_ttl:
+            return position
+        return None
 
-    def _do_get_position(self):
-        # Thorlabs positions start at 1, hence the -1
-        try:
-            return int(self._send_command("pos?")) - 1
-        except TypeError:
-            raise microscope.DeviceError(
-                "Unable to get position of %s", self.__class__.__name__
+    def _do_set_position(self, new_position: int) -> None:
+        with self._lock:
+            # The wheel can be moved by hand, so only trust a fresh
+            # position to skip a move.
+            if self._get_cached_position_locked() == new_position:
+                return
+            self._send_command_locked(
+                self._set_position_commands[new_position]
             )
+            self._position_cache = (new_position, time.monotonic())
 
-    def _readline(self):
-        """Custom _readline to overcome limitations of the serial implementation."""
-        result = []
+    def _do_get_position(self):
         with self._lock:
-            while not result or result[-1] not in ("\n", ""):
-                char = self.connection.read()
-                # Do not allow lines to be empty.
-                if result or (char not in string.whitespace):
-                    result.append(char)
-        return "".join(result)
+            position = self._get_cached_position_locked()
+            if position is not None:
+                return position
+            # Thorlabs positions start at 1, hence the -1
+            try:
+                position = int(self._send_command_locked("pos?")) - 1
+            except TypeError:
+                raise microscope.DeviceError(
+                    "Unable to get position of %s", self.__class__.__name__
+                )
+            self._position_cache = (position, time.monotonic())
+        return position
+
+    def _read_response(self):
+        """Read a whole response, up to and including the prompt.
+
+        Returns the response without the prompt.  This is the command
+        echo, followed by the result if the command was a query.
+        """
+        # Serial.read_until reads one byte at a time so instead read
+        # whatever is already buffered in one go, only blocking for
+        # the next byte when nothing is.  Anything after the prompt
+        # is padding and is dropped.
+        response = bytearray()
+        while self.prompt not in response:
+            chunk = self.connection.read(max(1, self.connection.in_waiting))
+            if not chunk:  # timeout
+                break
+            response.extend(chunk)
+        return bytes(response.partition(self.prompt)[0])
 
     def _send_command(self, command):
         """Send a command and return any result."""
         with self._lock:
-            self.connection.write(command + self.eol)
-            response = "dummy"
-            while command not in response and ">" not in response:
-                # Read until we receive the command echo.
-                response = self._readline().strip()
-            if command.endswith("?"):
-                # Last response was the command. Next is result.
-                return self._readline().strip()
+            return self._send_command_locked(command)
+
+    def _send_command_locked(self, command):
+        """Like `_send_command` but the caller must hold `_lock`."""
+        # Discard anything left over from a previous exchange, e.g.,
+        # one that timed out, so it is not mistaken for this response.
+        self.connection.reset_input_buffer()
+        encoded_command = command.encode("ascii")
+        self.connection.write(encoded_command + self.eol)
+        response = self._read_response()
+        if not command.endswith("?"):
+            # Only the prompt matters, there is no result to parse.
+            return None
+        lines = [
+            line.strip()
+            for line in response.replace(b"\n", self.eol).split(self.eol)
+            if line.strip()
+        ]
+        if len(lines) > 1 and lines[0].startswith(encoded_command):
+            # First line is the command echo. Next is result.
+            return lines[1].decode("ascii")
         return None
 
 
@@ -31,8 +31,9 @@ with ``pip install microscope[GUI]``.
 """
 
 import argparse
+import collections
+import functools
 import logging
-import queue
 import sys
 import threading
 from typing import Dict, List, Optional, Sequence
@@ -52,6 +53,13 @@ Pyro4.config.SERIALIZERS_ACCEPTED.add("pickle")
 Pyro4.config.SERIALIZER = "pickle"
 
 
+# QImage formats for the numpy dtypes that CameraWidget can display.
+_NP_TO_QT_FORMAT = {
+    np.dtype("uint8"): QtGui.QImage.Format_Grayscale8,
+    np.dtype("uint16"): QtGui.QImage.Format_Grayscale16,
+}
+
+
 class DeviceSettingsWidget(QtWidgets.QWidget):
     """Table of device settings and its values.
 
@@ -91,6 +99,7 @@ class ControllerWidget(QtWidgets.QWidget):
         ] = {}
         self._button2name: Dict[QtWidgets.QPushButton, str] = {}
 
+        layout = QtWidgets.QVBoxLayout()
         self._button_grp = QtWidgets.QButtonGroup(self)
         self._button_grp.setExclusive(False)
         for name in self._device.devices.keys():
@@ -99,11 +108,9 @@ class ControllerWidget(QtWidgets.QWidget):
             self._button_grp.addButton(button)
             self._button2name[button] = name
             self._button2window[button] = None
+            layout.addWidget(button)
         self._button_grp.buttonToggled.connect(self.toggleDeviceWidget)
 
-        layout = QtWidgets.QVBoxLayout()
-        for button in self._button_grp.buttons():
-            layout.addWidget(button)
         self.setLayout(layout)
 
     def toggleDeviceWidget(
@@ -127,10 +134,41 @@ class ControllerWidget(QtWidgets.QWidget):
                 self._button2window[button] = None
 
 
-class _DataQueue(queue.Queue):
+class _LatestData:
+    """Holds only the most recent data put, discarding the previous.
+
+    This is used instead of a `queue.Queue` as camera client when we
+    only care about the last image and can drop the others.
+    """
+
+    def __init__(self) -> None:
+        # A deque append and popleft are atomic so we don't need a
+        # lock.  With maxlen=1, append discards the previous data.
+        self._data: collections.deque = collections.deque(maxlen=1)
+        self._has_data = threading.Event()
+
     @Pyro4.expose
-    def put(self, *args, **kwargs):
-        return super().put(*args, **kwargs)
+    @Pyro4.oneway
+    def put(self, data) -> None:
+        # oneway so that a remote camera does not wait for our reply
+        # before sending the next image.
+        self._data.append(data)
+        self._has_data.set()
+
+    def get(self):
+        """Remove and return the data, blocking until there is some.
+
+        Only one thread should be calling `get`.
+        """
+        while True:
+            self._has_data.wait()
+            self._has_data.clear()
+            try:
+                return self._data.popleft()
+            except IndexError:
+                # A put raced with our previous get which already
+                # took its data.  Wait for the next one.
+                continue
 
 
 class _Imager(QtCore.QObject):
@@ -141,41 +179,110 @@ class _Imager(QtCore.QObject):
     def __init__(self, camera: microscope.abc.Camera) -> None:
         super().__init__()
         self._camera = camera
-        self._data_queue = _DataQueue()
+        self._latest_data = _LatestData()
+        # Set when the GUI has finished displaying the last image
+        # emitted.
+        self._image_displayed = threading.Event()
+        self._image_displayed.set()
         if isinstance(self._camera, Pyro4.Proxy):
+            # A remote camera needs a Pyro daemon to send us data.
+            # Local cameras call put directly, no daemon or
+            # serialisation involved.
             pyro_daemon = Pyro4.Daemon()
-            queue_uri = pyro_daemon.register(self._data_queue)
-            self._camera.set_client(queue_uri)
+            data_uri = pyro_daemon.register(self._latest_data)
+            self._camera.set_client(data_uri)
             data_thread = threading.Thread(
                 target=pyro_daemon.requestLoop, daemon=True
             )
             data_thread.start()
         else:
-            self._device.set_client(self._data_queue)
+            self._camera.set_client(self._latest_data)
         fetch_thread = threading.Thread(target=self.fetchLoop, daemon=True)
         fetch_thread.start()
 
-        # Depending on the Qt backend this might not get called (seems
-        # to work on PySide2 but not with PyQt5).  The device itself
-        # should be removing clients that no longer work anyway.
-        self.destroyed.connect(lambda: self._camera.set_client(None))
+        # Remove ourselves as client when the application quits.  The
+        # destroyed signal is not reliable for this since, depending
+        # on the Qt backend, it might not get emitted (seems to work
+        # on PySide2 but not with PyQt5).  The device itself should
+        # be removing clients that no longer work anyway.
+        app = QtWidgets.QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self._removeClient)
+
+    def _removeClient(self) -> None:
+        if isinstance(self._camera, Pyro4.Proxy):
+            # Do not hang on exit if the camera is no longer there.
+            self._camera._pyroTimeout = 0.5
+        try:
+            self._camera.set_client(None)
+        except Pyro4.errors.PyroError as ex:
+            _logger.info("failed to remove client from camera: %s", ex)
 
     def snap(self) -> None:
         self._camera.trigger()
 
+    def imageDisplayed(self) -> None:
+        """Report that the last image emitted has been displayed."""
+        self._image_displayed.set()
+
     def fetchLoop(self) -> None:
         while True:
-            # We may be getting images faster than we can display so
-            # only get the last image in the queue and discard the
-            # rest (we could do with a class that only has one item
-            # and putting a new item will discard the previous instead
-            # of blocking/queue).
-            data = self._data_queue.get()
-            while not self._data_queue.empty():
-                data = self._data_queue.get()
+            # We may be getting images faster than we can display.
+            # Do not emit a new image until the previous one has been
+            # displayed, otherwise they pile up in the Qt event queue.
+            # _LatestData only keeps the last image so the ones we
+            # did not have time to display are discarded.
+            self._image_displayed.wait()
+            data = self._latest_data.get()
+            self._image_displayed.clear()
             self.imageAcquired.emit(data)
 
 
+class _ImageView(QtWidgets.QWidget):
+    """Helper for CameraWidget to display images.
+
+    Unlike a `QLabel` showing a pixmap, displaying a new image only
+    causes a relayout if the image size changes.  The image is also
+    painted directly from the array memory instead of being first
+    converted to a `QPixmap`.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # The QImage does not own its pixels, it wraps the array
+        # memory, so we need to keep a reference to the array too.
+        self._data: Optional[np.ndarray] = None
+        self._image = QtGui.QImage()
+
+    def setData(self, data: np.ndarray) -> None:
+        # QImage requires the pixels to be contiguous in memory.
+        if not data.flags.c_contiguous:
+            data = np.ascontiguousarray(data)
+        image = QtGui.QImage(
+            data.data,
+            data.shape[1],
+            data.shape[0],
+            data.strides[0],
+            _NP_TO_QT_FORMAT[data.dtype],
+        )
+        size_changed = image.size() != self._image.size()
+        self._data = data
+        self._image = image
+        if size_changed:
+            self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QtCore.QSize:
+        return self._image.size()
+
+    def minimumSizeHint(self) -> QtCore.QSize:
+        return self._image.size()
+
+    def paintEvent(self, event: QtGui.QPaintEvent) -> None:
+        painter = QtGui.QPainter(self)
+        painter.drawImage(0, 0, self._image)
+
+
 class CameraWidget(QtWidgets.QWidget):
     """Display camera"""
 
@@ -185,10 +292,9 @@ class CameraWidget(QtWidgets.QWidget):
         self._imager = _Imager(self._device)
         self._imager.imageAcquired.connect(self.displayData)
 
-        self._view = QtWidgets.QLabel(parent=self)
-        self.displayData(
-            np.zeros(self._device.get_sensor_shape(), dtype=np.uint8)
-        )
+        self._view = _ImageView(parent=self)
+        width, height = self._device.get_sensor_shape()
+        self.displayData(np.zeros((height, width), dtype=np.uint8))
 
         self._enable_check = QtWidgets.QCheckBox("Enabled", parent=self)
         self._enable_check.stateChanged.connect(self.updateEnableState)
@@ -222,25 +328,29 @@ class CameraWidget(QtWidgets.QWidget):
         else:
             self._device.disable()
 
-        if self._enable_check.isChecked() != self._device.get_is_enabled():
-            self._enable_check.setChecked(self._device.get_is_enabled())
+        device_is_enabled = self._device.get_is_enabled()
+
+        if self._enable_check.isChecked() != device_is_enabled:
             _logger.error(
                 "failed to %s camera",
                 "enable" if self._enable_check.isChecked() else "disable",
             )
+            # Block signals or stateChanged would call us again and
+            # try to undo the enable/disable that just failed.
+            self._enable_check.blockSignals(True)
+            self._enable_check.setChecked(device_is_enabled)
+            self._enable_check.blockSignals(False)
 
-        self._snap_button.setEnabled(self._device.get_is_enabled())
-        self._exposure_box.setEnabled(self._device.get_is_enabled())
+        self._snap_button.setEnabled(device_is_enabled)
+        self._exposure_box.setEnabled(device_is_enabled)
 
     def displayData(self, data: np.ndarray) -> None:
-        np_to_qt = {
-            np.dtype("uint8"): QtGui.QImage.Format_Grayscale8,
-            np.dtype("uint16"): QtGui.QImage.Format_Grayscale16,
-        }
-        qt_img = QtGui.QImage(
-            data.tobytes(), *data.shape, np_to_qt[data.dtype]
-        )
-        self._view.setPixmap(QtGui.QPixmap.fromImage(qt_img))
+        try:
+            self._view.setData(data)
+        finally:
+            # Even if this image can't be displayed, the imager must
+            # still send the next one.
+            self._imager.imageDisplayed()
 
 
 class DeformableMirrorWidget(QtWidgets.QWidget):
@@ -257,17 +367,34 @@ class DeformableMirrorWidget(QtWidgets.QWidget):
         super().__init__(*args, **kwargs)
         self._device = device
 
-        self._pattern = np.ndarray(shape=(self._device.n_actuators))
+        # On a remote device each property access is a round-trip so
+        # only get the number of actuators once.
+        n_actuators = self._device.n_actuators
+        self._pattern = np.full(n_actuators, 0.5)
+
+        # Dragging a slider emits valueChanged for each step.  Instead
+        # of applying a new pattern for each of them, wait until the
+        # sliders have stopped changing for a bit.
+        self._apply_timer = QtCore.QTimer(self)
+        self._apply_timer.setSingleShot(True)
+        self._apply_timer.setInterval(30)  # msec
+        self._apply_timer.timeout.connect(self.applyPattern)
+
+        # Applying a pattern is a remote call when the device is a
+        # Pyro proxy, so do it on a separate thread to keep the GUI
+        # responsive.
+        self._latest_pattern = _LatestData()
+        apply_thread = threading.Thread(target=self._applyLoop, daemon=True)
+        apply_thread.start()
+
         self._actuators: List[QtWidgets.QSlider] = []
-        for i in range(self._device.n_actuators):
+        for i in range(n_actuators):
             actuator = QtWidgets.QSlider(QtCore.Qt.Horizontal, parent=self)
             actuator.setMinimum(0)
             actuator.setMaximum(100)
-
-            def setThisActuator(value, actuator_index=i):
-                self.setActuatorValue(actuator_index, value)
-
-            actuator.valueChanged.connect(setThisActuator)
+            actuator.valueChanged.connect(
+                functools.partial(self.setActuatorValue, i)
+            )
             self._actuators.append(actuator)
         # We don't know the pattern currently applied to the mirror so
         # we reset it which also updates the slider positions.
@@ -288,21 +415,40 @@ class DeformableMirrorWidget(QtWidgets.QWidget):
         self.setLayout(main_layout)
 
     def setActuatorValue(self, actuator_index: int, value: int) -> None:
-        if not (0 < actuator_index < self._pattern.size):
+        if not (0 <= actuator_index < self._pattern.size):
             raise ValueError(
                 "index %d is invalid because DM has %d actuators"
                 % (actuator_index, self._pattern.size)
             )
         self._pattern[actuator_index] = value / 100.0
-        self._device.apply_pattern(self._pattern)
+        self._apply_timer.start()
+
+    def applyPattern(self) -> None:
+        """Apply the current pattern to the device."""
+        # Send a copy since the sliders keep modifying _pattern.
+        self._latest_pattern.put(self._pattern.copy())
+
+    def _applyLoop(self) -> None:
+        while True:
+            # Only the most recent pattern matters.  _LatestData
+            # discards any that were superseded while applying the
+            # previous one.
+            pattern = self._latest_pattern.get()
+            try:
+                self._device.apply_pattern(pattern)
+            except Exception as ex:
+                # Keep the loop running so later patterns are still
+                # applied.
+                _logger.error("failed to apply pattern", exc_info=ex)
 
     def resetPattern(self) -> None:
         """Set all actuators to their mid-point (0.5)."""
         self._pattern.fill(0.5)
-        self._device.apply_pattern(self._pattern)
-        for i, actuator in enumerate(self._actuators):
+        self._apply_timer.start()
+        positions = (self._pattern * 100).astype(int)
+        for actuator, position in zip(self._actuators, positions.tolist()):
             actuator.blockSignals(True)
-            actuator.setSliderPosition(int(self._pattern[i] * 100))
+            actuator.setSliderPosition(position)
             actuator.blockSignals(False)
 
 
@@ -319,11 +465,13 @@ class FilterWheelWidget(QtWidgets.QWidget):
         super().__init__(*args, **kwargs)
         self._device = device
 
+        layout = QtWidgets.QVBoxLayout()
         self._button_grp = QtWidgets.QButtonGroup(self)
         for i in range(self._device.n_positions):
             button = QtWidgets.QPushButton(str(i + 1), parent=self)
             button.setCheckable(True)
             self._button_grp.addButton(button, i)
+            layout.addWidget(button)
         self._button_grp.button(self._device.position).setChecked(True)
 
         # We use buttonClicked instead of idClicked because that
@@ -332,9 +480,6 @@ class FilterWheelWidget(QtWidgets.QWidget):
         # position.
         self._button_grp.buttonClicked.connect(self.setFilterWheelPosition)
 
-        layout = QtWidgets.QVBoxLayout()
-        for button in self._button_grp.buttons():
-            layout.addWidget(button)
         self.setLayout(layout)
 
     def setFilterWheelPosition(self) -> None:
@@ -351,19 +496,19 @@ class LightSourceWidget(QtWidgets.QWidget):
         self._enable_check = QtWidgets.QCheckBox("Enabled", parent=self)
         self._enable_check.stateChanged.connect(self.updateEnableState)
 
+        power = self._device.power
+
         self._set_power_box = QtWidgets.QDoubleSpinBox(parent=self)
         self._set_power_box.setMinimum(0.0)
         self._set_power_box.setMaximum(1.0)
-        self._set_power_box.setValue(self._device.power)
+        self._set_power_box.setValue(power)
         self._set_power_box.setSingleStep(0.01)
         self._set_power_box.setAlignment(QtCore.Qt.AlignRight)
         self._set_power_box.valueChanged.connect(
             lambda x: setattr(self._device, "power", x)
         )
 
-        self._current_power = QtWidgets.QLineEdit(
-            str(self._device.power), parent=self
-        )
+        self._current_power = QtWidgets.QLineEdit(str(power), parent=self)
         self._current_power.setReadOnly(True)
         self._current_power.setAlignment(QtCore.Qt.AlignRight)
 
@@ -391,11 +536,15 @@ class LightSourceWidget(QtWidgets.QWidget):
         device_is_enabled = self._device.get_is_enabled()
 
         if self._enable_check.isChecked() != device_is_enabled:
-            self._enable_check.setChecked(device_is_enabled)
             _logger.error(
                 "failed to %s light",
                 "enable" if self._enable_check.isChecked() else "disable",
             )
+            # Block signals or stateChanged would call us again and
+            # try to undo the enable/disable that just failed.
+            self._enable_check.blockSignals(True)
+            self._enable_check.setChecked(device_is_enabled)
+            self._enable_check.blockSignals(False)
 
         self._current_power.setEnabled(device_is_enabled)
         if device_is_enabled:
@@ -405,7 +554,9 @@ class LightSourceWidget(QtWidgets.QWidget):
             self._current_power.setText("0.0")
 
     def updateCurrentPower(self) -> None:
-        self._current_power.setText(str(self._device.power))
+        power = str(self._device.power)
+        if power != self._current_power.text():
+            self._current_power.setText(power)
 
 
 class StageWidget(QtWidgets.QWidget):
@@ -421,30 +572,32 @@ class StageWidget(QtWidgets.QWidget):
         super().__init__(*args, **kwargs)
         self._device = device
 
+        # Keep our own reference to the axes so that moving one does
+        # not need to get all axes from the device first.
+        self._axes = dict(self._device.axes)
+
         layout = QtWidgets.QFormLayout(self)
-        for name, axis in self._device.axes.items():
-            label = "%s (%s : %s)" % (
-                name,
-                axis.limits.lower,
-                axis.limits.upper,
-            )
+        for name, axis in self._axes.items():
+            # On a remote stage each property access is a round-trip
+            # so only get the limits once.
+            limits = axis.limits
+            label = "%s (%s : %s)" % (name, limits.lower, limits.upper)
 
             position_box = QtWidgets.QDoubleSpinBox(parent=self)
-            position_box.setMinimum(axis.limits.lower)
-            position_box.setMaximum(axis.limits.upper)
+            position_box.setMinimum(limits.lower)
+            position_box.setMaximum(limits.upper)
             position_box.setValue(axis.position)
             position_box.setSingleStep(1.0)
-
-            def setPositionSlot(position: float, name: str = name):
-                return self.setPosition(name, position)
-
-            position_box.valueChanged.connect(setPositionSlot)
+            # Only move once the user has finished typing the new
+            # position instead of once per keystroke.
+            position_box.setKeyboardTracking(False)
+            position_box.valueChanged.connect(axis.move_to)
 
             layout.addRow(label, position_box)
         self.setLayout(layout)
 
     def setPosition(self, name: str, position: float) -> None:
-        self._device.axes[name].move_to(position)
+        self._axes[name].move_to(position)
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -464,23 +617,33 @@ class MainWindow(QtWidgets.QMainWindow):
             shortcut.activated.connect(slot)
 
 
+# Attribute that identifies each device type and the widget to use,
+# in the order they should be checked.
+_WIDGET_FOR_ATTRIBUTE = (
+    ("axes", StageWidget),
+    ("devices", ControllerWidget),
+    ("n_positions", FilterWheelWidget),
+    ("power", LightSourceWidget),
+    ("n_actuators", DeformableMirrorWidget),
+    ("get_sensor_shape", CameraWidget),
+    ("get_all_settings", DeviceSettingsWidget),
+)
+
+
 def _guess_device_widget(device) -> QtWidgets.QWidget:
-    if hasattr(device, "axes"):
-        return StageWidget
-    elif hasattr(device, "devices"):
-        return ControllerWidget
-    elif hasattr(device, "n_positions"):
-        return FilterWheelWidget
-    elif hasattr(device, "power"):
-        return LightSourceWidget
-    elif hasattr(device, "n_actuators"):
-        return DeformableMirrorWidget
-    elif hasattr(device, "get_sensor_shape"):
-        return CameraWidget
-    elif hasattr(device, "get_all_settings"):
-        return DeviceSettingsWidget
+    if isinstance(device, Pyro4.Proxy):
+        # hasattr on a proxy gets the value of remote attributes,
+        # which is a remote call for each.  The proxy metadata
+        # already has the names of all attributes and methods.
+        device._pyroBind()
+        names = device._pyroAttrs | device._pyroMethods
+        has_attribute = names.__contains__
     else:
-        raise TypeError("device is not a Microscope Device")
+        has_attribute = functools.partial(hasattr, device)
+    for attribute, widget_cls in _WIDGET_FOR_ATTRIBUTE:
+        if has_attribute(attribute):
+            return widget_cls
+    raise TypeError("device is not a Microscope Device")
 
 
 def main(argv: Sequence[str]) -> int:
@@ -19,9 +19,11 @@
 ## along with Microscope.  If not, see <http://www.gnu.org/licenses/>.
 
 import logging
+import time
 
 import serial
 
+import microscope
 import microscope._utils
 import microscope.abc
 
@@ -53,6 +55,9 @@ class CoboltLaser(
             bytesize=serial.EIGHTBITS,
             parity=serial.PARITY_NONE,
         )
+        # How long to wait for the reply to a query.  The controller
+        # is sometimes slower than the serial timeout to reply.
+        self._query_timeout = max(timeout, 0.5)
         # Start a logger.
         response = self.send(b"sn?")
         _logger.info("Cobolt laser serial number: [%s]", response.decode())
@@ -67,15 +72,20 @@ class CoboltLaser(
 
     def send(self, command):
         """Send command and retrieve response."""
-        success = False
-        while not success:
-            self._write(command)
-            response = self._readline()
-            # Catch zero-length responses to queries and retry.
-            if not command.endswith(b"?"):
-                success = True
-            elif len(response) > 0:
-                success = True
+        self._write(command)
+        response = self._readline()
+        if command.endswith(b"?"):
+            # Queries always have a reply.  If it is slow to arrive,
+            # keep reading instead of sending the query again, since
+            # the extra reply would then be read as the reply to the
+            # next command.
+            deadline = time.monotonic() + self._query_timeout
+            while not response and time.monotonic() < deadline:
+                response = self._readline()
+            if not response:
+                raise microscope.DeviceError(
+                    "No reply to query '%s'" % command.decode()
+                )
         return response
 
     @microscope.abc.SerialDeviceMixin.lock_comms
@@ -383,6 +383,18 @@ class TestCoboltLaser(unittest.TestCase, LightSourceTests, SerialDeviceTests):
 
         self.fake = CoboltLaserMock
 
+    def test_query_without_reply(self):
+        # A query that gets no reply is not sent again while waiting
+        # for one, and eventually fails.
+        self.device._query_timeout = 0.05
+        with unittest.mock.patch.object(
+            self.device.connection, "handle", return_value=None
+        ) as handle:
+            with self.assertRaises(microscope.DeviceError):
+                self.device.send(b"sn?")
+        handle.assert_called_once()
+        self.assertEqual(handle.call_args[0][0].strip(), b"sn?")
+
 
 class TestOmicronDeepstarLaser(
     unittest.TestCase, LightSourceTests, SerialDeviceTests